@@ -0,0 +1,96 @@
+/*
+ * WS2812 SPI frame encoder for the Raspberry Pi 5 (Cortex-A76, AArch64 NEON).
+ *
+ * Every color byte becomes 3 SPI bytes: each data bit is sent as 100 (0) or 110 (1), MSB first.
+ * The high nibble of a color byte determines the first 12 SPI bits and the low nibble the last 12,
+ * so the 3 output bytes can be looked up per nibble with 16-entry tables (one TBL instruction each).
+ * The tables hardcode the 100/110 patterns of WS2812SpiDriver.LED_ZERO / LED_ONE, which are fixed
+ * by the LED timing; the driver checks this encoder against its lookup table before using it.
+ *
+ * Build:
+ *     cc -O3 -mcpu=cortex-a76 -shared -fPIC -o _encode_neon.so encode_neon.c
+ */
+#include <stddef.h>
+#include <stdint.h>
+
+#if defined(__aarch64__) && defined(__ARM_NEON)
+#include <arm_neon.h>
+#endif
+
+/* Color bytes per cache block (3 KB of SPI output), a multiple of 16 */
+#define ENCODE_CHUNK 1024
+#define CACHE_LINE 64
+
+/* First SPI byte: bits 11..4 of the 12-bit pattern of the high nibble */
+static const uint8_t T0[16] = {
+    0x92, 0x92, 0x93, 0x93, 0x9A, 0x9A, 0x9B, 0x9B, 0xD2, 0xD2, 0xD3, 0xD3, 0xDA, 0xDA, 0xDB, 0xDB,
+};
+/* Upper half of the second SPI byte: bits 3..0 of the 12-bit pattern of the high nibble */
+static const uint8_t T1H[16] = {
+    0x40, 0x60, 0x40, 0x60, 0x40, 0x60, 0x40, 0x60, 0x40, 0x60, 0x40, 0x60, 0x40, 0x60, 0x40, 0x60,
+};
+/* Lower half of the second SPI byte: bits 11..8 of the 12-bit pattern of the low nibble */
+static const uint8_t T1L[16] = {
+    0x09, 0x09, 0x09, 0x09, 0x09, 0x09, 0x09, 0x09, 0x0D, 0x0D, 0x0D, 0x0D, 0x0D, 0x0D, 0x0D, 0x0D,
+};
+/* Third SPI byte: bits 7..0 of the 12-bit pattern of the low nibble */
+static const uint8_t T2[16] = {
+    0x24, 0x26, 0x34, 0x36, 0xA4, 0xA6, 0xB4, 0xB6, 0x24, 0x26, 0x34, 0x36, 0xA4, 0xA6, 0xB4, 0xB6,
+};
+
+/*
+ * Encode n color bytes from in into 3 * n SPI bytes at out.
+ */
+void encode(const uint8_t *in, uint8_t *out, size_t n)
+{
+    size_t i = 0;
+
+#if defined(__aarch64__) && defined(__ARM_NEON)
+    const uint8x16_t t0 = vld1q_u8(T0);
+    const uint8x16_t t1h = vld1q_u8(T1H);
+    const uint8x16_t t1l = vld1q_u8(T1L);
+    const uint8x16_t t2 = vld1q_u8(T2);
+    const uint8x16_t low_mask = vdupq_n_u8(0x0F);
+
+    /* Work through the input in ENCODE_CHUNK blocks so the current input and output blocks stay in L1 */
+    while (i + 16 <= n) {
+        size_t block_end = i + ENCODE_CHUNK;
+        size_t p;
+
+        if (block_end > n)
+            block_end = n;
+
+        /* Soft prefetch of the next input block while this one is encoded */
+        for (p = block_end; p < block_end + ENCODE_CHUNK && p < n; p += CACHE_LINE)
+            __builtin_prefetch(in + p);
+
+        /* 16 color bytes -> 48 SPI bytes per iteration */
+        for (; i + 16 <= block_end; i += 16) {
+            uint8x16_t v = vld1q_u8(in + i);
+            uint8x16_t hi = vshrq_n_u8(v, 4);
+            uint8x16_t lo = vandq_u8(v, low_mask);
+            uint8x16x3_t o;
+
+            o.val[0] = vqtbl1q_u8(t0, hi);
+            o.val[1] = vorrq_u8(vqtbl1q_u8(t1h, hi), vqtbl1q_u8(t1l, lo));
+            o.val[2] = vqtbl1q_u8(t2, lo);
+            /* Interleaving store: writes byte 0, 1, 2 of each color byte consecutively */
+            vst3q_u8(out + 3 * i, o);
+        }
+
+        /* A block end that is not a multiple of 16 is only possible at the end of the input */
+        if (i < block_end)
+            break;
+    }
+#endif
+
+    /* Remaining bytes (or everything on non-NEON builds) */
+    for (; i < n; i++) {
+        uint8_t hi = in[i] >> 4;
+        uint8_t lo = in[i] & 0x0F;
+
+        out[3 * i] = T0[hi];
+        out[3 * i + 1] = T1H[hi] | T1L[lo];
+        out[3 * i + 2] = T2[lo];
+    }
+}
@@ -1,8 +1,134 @@
+import ctypes
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import numpy as np
 from spidev import SpiDev
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, the NumPy lookup table is used instead
+    njit = None
+
+
+# 24-bit SPI pattern of a 0x00 byte: eight "100" groups. A 1 bit only sets the middle bit of its group.
+# Hardcodes WS2812SpiDriver.LED_ZERO / LED_ONE (100 / 110), which are fixed by the LED timing.
+_SPI_PATTERN_BASE = 0x924924
+
+
+if njit is not None:
+
+    @njit(cache=True, boundscheck=False)
+    def _encode_frame(colors, out):
+        """
+        Expand every color byte into its 3-byte SPI pattern (100 for a 0 bit, 110 for a 1 bit, MSB first).
+        The data bits are spread three positions apart with the same SWAR steps as _spread_bits().
+        :param colors: Flat uint8 array of GRB(W) bytes
+        :param out: (len(colors), 3) uint8 view of the encoded part of the SPI frame
+        """
+        # Bounds checks are off, so never index past out even if the caller passed a wrong size
+        if colors.shape[0] != out.shape[0]:
+            raise ValueError("colors and out must hold the same number of bytes")
+        for i in range(colors.shape[0]):
+            x = np.uint32(colors[i])
+            x = (x | (x << 8)) & 0x00F00F
+            x = (x | (x << 4)) & 0x0C30C3
+            x = (x | (x << 2)) & 0x249249
+            pattern = _SPI_PATTERN_BASE | (x << 1)
+            out[i, 0] = (pattern >> 16) & 0xFF
+            out[i, 1] = (pattern >> 8) & 0xFF
+            out[i, 2] = pattern & 0xFF
+
+else:
+    _encode_frame = None
+
+
+def _spread_bits(x: np.ndarray) -> np.ndarray:
+    """
+    Spread the 8 bits of each value three positions apart (bit k moves to bit 3k), branch-free.
+    :param x: uint32 array of byte values
+    :return: uint32 array with the spread bits
+    """
+    x = (x | (x << 8)) & 0x00F00F
+    x = (x | (x << 4)) & 0x0C30C3
+    return (x | (x << 2)) & 0x249249
+
+
+def _load_neon_encoder():
+    """
+    Load the compiled NEON encoder (encode_neon.c) if it has been built next to this module.
+    :return: The C encode(in, out, n) function, or None if the shared library is not available
+    """
+    try:
+        lib = ctypes.CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), "_encode_neon.so"))
+        encode = lib.encode
+    except (OSError, AttributeError):  # missing library, or a stale/foreign one without encode()
+        return None
+    encode.argtypes = (ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t)
+    encode.restype = None
+    return encode
+
+
+_neon_encode = _load_neon_encoder()
+
+
+def _read_spidev_bufsiz(default: int = 4096) -> int:
+    """
+    Read the maximum transfer size of the spidev kernel module.
+    :param default: Value to use if the module parameter is not readable (spidev default)
+    :return: Maximum number of bytes per write() on a spidev file descriptor
+    """
+    try:
+        with open("/sys/module/spidev/parameters/bufsiz") as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return default
+
+
+def _quantize_brightness(brightness: float) -> int:
+    """
+    Quantize a brightness to 8 bits for integer scaling.
+    :param brightness: The brightness as a float, clamped to 0.0-1.0
+    :return: The brightness as an int between 0 and 255
+    """
+    return round(max(min(brightness, 1.0), 0.0) * 255)
+
+
+def _split_transfers(data: memoryview, max_transfer: int) -> tuple[memoryview, ...]:
+    """
+    Split a buffer into zero-copy memoryview slices of at most max_transfer bytes.
+    :param data: The buffer to split
+    :param max_transfer: Maximum slice size in bytes
+    :return: The slices, in order
+    """
+    return tuple(data[start:start + max_transfer] for start in range(0, len(data), max_transfer))
+
+
+class _SpiFrame:
+    """
+    A pre-allocated SPI frame buffer together with the views the encoders and the writer use.
+    """
+    __slots__ = ('buffer', 'transfers', 'payload', 'payload_3d', 'payload_addr')
+
+    def __init__(self, size: int, preamble: int, max_transfer: int):
+        """
+        Allocate a zeroed frame.
+        :param size: Total frame size in bytes, including the preamble
+        :param preamble: Number of leading zero bytes before the encoded colors
+        :param max_transfer: Maximum number of bytes per SPI write
+        """
+        self.buffer = bytearray(size)
+        # Slices handed to the SPI writes, created once so sending a frame copies nothing
+        self.transfers = _split_transfers(memoryview(self.buffer), max_transfer)
+        # Views onto the encoded part of the frame only. The preamble zeros are written once here and
+        # never touched again, so no encoder has to know about the preamble offset.
+        self.payload = np.frombuffer(self.buffer, dtype=np.uint8, offset=preamble)
+        # (num_bytes, 3) view, the target of the gather and numba encoders
+        self.payload_3d = self.payload.reshape(-1, 3)
+        # Address of the first encoded byte for the C encoder
+        self.payload_addr = self.payload.ctypes.data
+
 
 class Color:
     """
@@ -53,15 +179,48 @@ class Strip:
         """
         self._led_count = backend.get_led_count()
         self._brightness = 1.0
+        # Brightness quantized to 8 bits (255 == 1.0) for integer scaling in show()
+        self._bright_u8 = 255
         self._has_white = has_white
-        self._pixels: list[Color] = [Color(0, 0, 0, 0)] * self._led_count
         self._backend = backend
+        # Bound once so the hot path skips the attribute lookup on the backend
+        self._write = backend.write
+        self._clear_backend = backend.clear
+        # Drivers that fold the brightness into their encoding get unscaled colors from show()
+        self._backend_scales = getattr(backend, "supports_brightness", False)
+        if self._backend_scales:
+            # The driver keeps the brightness of the last strip, start it in sync with this one
+            backend.set_brightness(self._brightness)
+
+        # Structure-of-Arrays pixel storage: one contiguous row per channel (R, G, B, W), so whole-strip
+        # updates are a single fill over one block of memory
+        self._channels = np.zeros((4, self._led_count), dtype=np.uint8)
+        self._r, self._g, self._b, self._w = self._channels
         
         # Pre-allocate NumPy buffer for fast pixel-to-array conversion
         if has_white:
             self._pixel_buffer = np.zeros((self._led_count, 4), dtype=np.uint8)
         else:
             self._pixel_buffer = np.zeros((self._led_count, 3), dtype=np.uint8)
+        
+        # Scratch arrays for brightness scaling, so show() allocates nothing per frame
+        self._scale_buffer = np.zeros(self._led_count, dtype=np.uint16)
+        self._scale_carry = np.zeros(self._led_count, dtype=np.uint16)
+
+    def set_pixel_rgb(self, i: int, r: int, g: int, b: int, w: int = 0) -> None:
+        """
+        Set the color of a single pixel from raw channel values, without creating a Color.
+        It is not written to the LED strip until show() is called.
+        :param i: The index of the pixel
+        :param r: Red channel (0-255)
+        :param g: Green channel (0-255)
+        :param b: Blue channel (0-255)
+        :param w: White channel (0-255), default 0 for RGB compatibility
+        """
+        self._r[i] = r
+        self._g[i] = g
+        self._b[i] = b
+        self._w[i] = w
 
     def set_pixel_color(self, i: int, color: Color) -> None:
         """
@@ -69,26 +228,39 @@ class Strip:
         :param i: The index of the pixel
         :param color: The color to set the pixel to
         """
-        self._pixels[i] = color
+        self.set_pixel_rgb(i, color.r, color.g, color.b, color.w)
     
     def set_pixels_batch(self, start: int, colors: list) -> None:
         """
         Set multiple pixels at once (batch operation for performance).
         :param start: Starting index
-        :param colors: List of Color objects or tuples (r, g, b, w) or (r, g, b)
+        :param colors: List of Color objects or tuples (r, g, b, w) or (r, g, b), or a NumPy array
+                       of shape (n, 3) / (n, 4)
         """
-        for i, color in enumerate(colors):
-            idx = start + i
+        if isinstance(colors, np.ndarray):
+            self.set_pixels_array(start, colors)
+            return
+        
+        if isinstance(colors, (list, tuple)):
+            # Uniform lists of 3- or 4-tuples convert in one NumPy call and are copied column-wise
+            try:
+                rgbw_array = np.asarray(colors, dtype=np.uint8)
+            except (TypeError, ValueError, OverflowError):
+                rgbw_array = None
+            if rgbw_array is not None and rgbw_array.ndim == 2 and rgbw_array.shape[1] in (3, 4):
+                self.set_pixels_array(start, rgbw_array)
+                return
+        
+        # Fallback for mixed lists of Color objects and 3-/4-tuples
+        set_rgb = self.set_pixel_rgb
+        for idx, color in enumerate(colors, start):
             if idx >= self._led_count:
                 break
             if isinstance(color, Color):
-                self._pixels[idx] = color
+                set_rgb(idx, color.r, color.g, color.b, color.w)
             elif isinstance(color, (tuple, list)):
                 # Support both (r,g,b) and (r,g,b,w) tuples
-                if len(color) >= 4:
-                    self._pixels[idx] = Color(color[0], color[1], color[2], color[3])
-                else:
-                    self._pixels[idx] = Color(color[0], color[1], color[2], 0)
+                set_rgb(idx, *color[:4])
             else:
                 raise ValueError(f"Invalid color type: {type(color)}")
     
@@ -98,70 +270,73 @@ class Strip:
         :param start: Starting index
         :param rgbw_array: NumPy array of shape (n, 3) for RGB or (n, 4) for RGBW, dtype uint8
         """
-        n_pixels = len(rgbw_array)
-        end = min(start + n_pixels, self._led_count)
+        if rgbw_array.ndim != 2 or rgbw_array.shape[1] not in (3, 4):
+            raise ValueError(f"Invalid array shape: {rgbw_array.shape}. Expected (n, 3) or (n, 4)")
+        
+        end = min(start + len(rgbw_array), self._led_count)
         n_actual = end - start
+        if n_actual <= 0:
+            return
         
+        # One strided column copy per channel, no per-pixel Python work
+        self._r[start:end] = rgbw_array[:n_actual, 0]
+        self._g[start:end] = rgbw_array[:n_actual, 1]
+        self._b[start:end] = rgbw_array[:n_actual, 2]
         if rgbw_array.shape[1] == 4:
-            # RGBW array
-            for i in range(n_actual):
-                self._pixels[start + i] = Color(
-                    int(rgbw_array[i, 0]),
-                    int(rgbw_array[i, 1]),
-                    int(rgbw_array[i, 2]),
-                    int(rgbw_array[i, 3])
-                )
-        elif rgbw_array.shape[1] == 3:
-            # RGB array
-            for i in range(n_actual):
-                self._pixels[start + i] = Color(
-                    int(rgbw_array[i, 0]),
-                    int(rgbw_array[i, 1]),
-                    int(rgbw_array[i, 2]),
-                    0
-                )
+            self._w[start:end] = rgbw_array[:n_actual, 3]
         else:
-            raise ValueError(f"Invalid array shape: {rgbw_array.shape}. Expected (n, 3) or (n, 4)")
-
+            # RGB array
+            self._w[start:end] = 0
 
     def show(self) -> None:
         """
         Write the current pixel colors to the LED strip.
-        Note: Brightness is NOT applied here - it should be pre-applied in the color values
-        to avoid double-scaling when used with led-control's render functions.
+        The brightness is applied by the driver if it supports it, otherwise while copying the colors
+        into the GRB(W) buffer. At full brightness (the default) the colors are written unchanged, so
+        pre-scaled colors are not scaled twice.
         
         OPTIMIZED: Uses pre-allocated buffer and vectorized operations.
         """
-        # Fast path: Copy pixel data to pre-allocated buffer
-        # This is MUCH faster than list comprehension
-        for i in range(self._led_count):
-            pixel = self._pixels[i]
+        buf = self._pixel_buffer
+        bright = self._bright_u8
+        # GRB order for WS2812, GRBW order for SK6812
+        if bright == 255 or self._backend_scales:
+            # Column copies from the per-channel arrays into the pre-allocated buffer
+            buf[:, 0] = self._g
+            buf[:, 1] = self._r
+            buf[:, 2] = self._b
             if self._has_white:
-                # GRBW order for SK6812
-                self._pixel_buffer[i, 0] = pixel.g
-                self._pixel_buffer[i, 1] = pixel.r
-                self._pixel_buffer[i, 2] = pixel.b
-                self._pixel_buffer[i, 3] = pixel.w
-            else:
-                # GRB order for WS2812
-                self._pixel_buffer[i, 0] = pixel.g
-                self._pixel_buffer[i, 1] = pixel.r
-                self._pixel_buffer[i, 2] = pixel.b
+                buf[:, 3] = self._w
+        else:
+            # Integer multiply-shift in the same pass as the reorder, no float math and no temporaries.
+            # (t + 128 + ((t + 128) >> 8)) >> 8 is t / 255 rounded, exact for every uint8 product t.
+            tmp = self._scale_buffer
+            carry = self._scale_carry
+            channels = (self._g, self._r, self._b, self._w) if self._has_white else (self._g, self._r, self._b)
+            for col, channel in enumerate(channels):
+                np.multiply(channel, bright, out=tmp, dtype=np.uint16)
+                tmp += 128
+                np.right_shift(tmp, 8, out=carry)
+                tmp += carry
+                np.right_shift(tmp, 8, out=buf[:, col], casting="unsafe")
         
-        self._backend.write(self._pixel_buffer)
+        self._write(buf)
 
     def clear(self) -> None:
         """
         Clear the LED strip and the buffer by setting all pixels to off.
         """
-        self._pixels = [Color(0, 0, 0, 0)] * self._led_count
-        self._backend.clear()
+        self._channels.fill(0)
+        self._clear_backend()
 
     def set_brightness(self, brightness: float) -> None:
         """
         Set the brightness of the LED strip. The brightness is a float between 0.0 and 1.0.
         """
         self._brightness = max(min(brightness, 1.0), 0.0)
+        self._bright_u8 = _quantize_brightness(self._brightness)
+        if self._backend_scales:
+            self._backend.set_brightness(self._brightness)
 
     def num_pixels(self) -> int:
         """
@@ -181,7 +356,8 @@ class Strip:
         Set all pixels to the same color. The colors are not written to the LED strip until show() is called.
         :param color: The color to set all pixels to.
         """
-        self._pixels = [color] * self._led_count
+        # One broadcast store of the (4, 1) channel values over the whole strip
+        self._channels[:] = ((color.r,), (color.g,), (color.b,), (color.w,))
     
     def has_white_channel(self) -> bool:
         """
@@ -196,6 +372,9 @@ class WS2812StripDriver(ABC):
     Abstract base class for drivers
     """
 
+    # True if the driver applies the brightness passed to set_brightness() itself
+    supports_brightness: bool = False
+
     def __init__(self, has_white: bool = False):
         """
         Initialize the driver.
@@ -215,6 +394,13 @@ class WS2812StripDriver(ABC):
     def get_led_count(self) -> int:
         pass
 
+    def set_brightness(self, brightness: float) -> None:
+        """
+        Set the brightness the driver applies to written colors. Only used if supports_brightness is True.
+        :param brightness: The brightness as a float between 0.0 and 1.0
+        """
+        pass
+
     def get_strip(self) -> Strip:
         return Strip(self, self._has_white)
 
@@ -232,13 +418,21 @@ class WS2812SpiDriver(WS2812StripDriver):
 
     # Bit patterns for SPI encoding (3 SPI bits per data bit)
     # At 2.4MHz SPI: each SPI bit is ~0.42us
+    # These are fixed by the LED timing: the numba kernel (_SPI_PATTERN_BASE) and the tables in
+    # encode_neon.c hardcode 100/110 as well, only the lookup table is derived from the constants.
     LED_ZERO: int = 0b100  # 0.42us high, 0.83us low
     LED_ONE: int = 0b110   # 0.83us high, 0.42us low
     PREAMBLE: int = 42
     
-    # Pre-compute lookup table for SPI encoding (256 entries)
+    # The brightness is folded into the per-driver lookup table
+    supports_brightness: bool = True
+    
+    # Pre-compute lookup table for SPI encoding (256 entries x 3 SPI bytes)
     # This avoids bit manipulation in the hot path
-    _SPI_LOOKUP = None
+    _SPI_LOOKUP: np.ndarray | None = None
+    
+    # The NEON encoder, only set once its output has been checked against the lookup table
+    _NEON_ENCODE = None
 
     @classmethod
     def _init_spi_lookup(cls):
@@ -246,36 +440,55 @@ class WS2812SpiDriver(WS2812StripDriver):
         if cls._SPI_LOOKUP is not None:
             return
         
-        cls._SPI_LOOKUP = []
-        for byte_val in range(256):
-            # Encode each bit position
-            bits = []
-            for i in range(7, -1, -1):  # MSB first
-                bit = (byte_val >> i) & 1
-                bits.append('110' if bit else '100')
-            
-            # Convert 24-bit string to 3 bytes
-            bit_string = ''.join(bits)
-            packed = bytes([
-                int(bit_string[0:8], 2),
-                int(bit_string[8:16], 2),
-                int(bit_string[16:24], 2)
-            ])
-            cls._SPI_LOOKUP.append(packed)
-
-    def __init__(self, spi_bus: int, spi_device: int, led_count: int, has_white: bool = False):
+        # All 256 patterns at once, without selecting per bit: every 3-bit group starts as LED_ZERO
+        # and a 1 bit flips the bits in which LED_ONE differs, i.e. LED_ZERO ^ bit * (LED_ONE ^ LED_ZERO)
+        groups = _spread_bits(np.full(256, 0xFF, dtype=np.uint32))
+        bits = _spread_bits(np.arange(256, dtype=np.uint32))
+        patterns = (groups * cls.LED_ZERO) ^ (bits * (cls.LED_ONE ^ cls.LED_ZERO))
+        
+        # Split the 24-bit patterns into 3 bytes, MSB first
+        lookup = np.empty((256, 3), dtype=np.uint8)
+        lookup[:, 0] = (patterns >> 16) & 0xFF
+        lookup[:, 1] = (patterns >> 8) & 0xFF
+        lookup[:, 2] = patterns & 0xFF
+        cls._SPI_LOOKUP = lookup
+        
+        if _neon_encode is not None and cls._check_neon_encoder():
+            cls._NEON_ENCODE = _neon_encode
+
+    @classmethod
+    def _check_neon_encoder(cls) -> bool:
+        """
+        Encode every byte value once with the NEON encoder and compare it with the lookup table.
+        The input length is not a multiple of 16, so both the vector loop and the scalar tail are covered.
+        :return: True if the NEON encoder produces the same SPI bytes as the lookup table
+        """
+        colors = (np.arange(256 + 16 + 5) % 256).astype(np.uint8)
+        out = np.zeros((colors.size, 3), dtype=np.uint8)
+        _neon_encode(colors.ctypes.data, out.ctypes.data, colors.size)
+        return bool(np.array_equal(out, cls._SPI_LOOKUP[colors]))
+
+    def __init__(
+        self, spi_bus: int, spi_device: int, led_count: int, has_white: bool = False, double_buffered: bool = True
+    ):
         """
         Initialize the SPI driver.
         :param spi_bus: SPI bus number (usually 0)
         :param spi_device: SPI device number (usually 0)
         :param led_count: Number of LEDs in the strip
         :param has_white: True for SK6812-RGBW (4 bytes per pixel), False for WS2812 (3 bytes per pixel)
+        :param double_buffered: Transmit frames in a background thread so the next frame can be
+                                encoded while the current one is on the wire
         """
         super().__init__(has_white)
         
         # Initialize lookup table once
         WS2812SpiDriver._init_spi_lookup()
         
+        # Lookup table at the current brightness, shared with the class table at full brightness
+        self._lut_spi = WS2812SpiDriver._SPI_LOOKUP
+        self._full_brightness = True
+        
         self._device = SpiDev()
         self._device.open(spi_bus, spi_device)
 
@@ -283,6 +496,15 @@ class WS2812SpiDriver(WS2812StripDriver):
         self._device.max_speed_hz = 2_400_000
         self._device.mode = 0b00
         self._device.lsbfirst = False
+        
+        # Write frames directly to the configured spidev file descriptor, this skips the copy
+        # writebytes2 makes of every frame. Writes larger than the spidev bufsiz are rejected
+        # by the kernel, so frames are sent in chunks of that size.
+        try:
+            self._fd = self._device.fileno()
+        except AttributeError:  # older spidev releases, fall back to writebytes2
+            self._fd = None
+        self._max_transfer = _read_spidev_bufsiz()
 
         self._led_count = led_count
         
@@ -293,11 +515,31 @@ class WS2812SpiDriver(WS2812StripDriver):
         # Total SPI bytes = led_count * bytes_per_pixel * 3
         spi_bytes = led_count * self._bytes_per_pixel * 3
         
+        # Number of color bytes write() accepts, the encoders write exactly 3 SPI bytes for each
+        self._n_color_bytes = led_count * self._bytes_per_pixel
+        
         # Initialize clear buffer
         self._clear_buffer = bytearray(WS2812SpiDriver.PREAMBLE + spi_bytes)
+        self._clear_transfers = _split_transfers(memoryview(self._clear_buffer), self._max_transfer)
         
-        # Pre-allocate SPI buffer for performance
-        self._spi_buffer = bytearray(WS2812SpiDriver.PREAMBLE + spi_bytes)
+        # Double buffering only for frames that fit into a single spidev write. A frame sent as several
+        # writes from the worker thread can stall between them while the caller holds the GIL, and a gap
+        # longer than the LED reset time latches the strip mid-frame.
+        frame_size = WS2812SpiDriver.PREAMBLE + spi_bytes
+        double_buffered = double_buffered and frame_size <= self._max_transfer
+        
+        # Pre-allocate SPI buffers for performance. With double buffering one frame is encoded
+        # while the other one is still being transmitted.
+        n_frames = 2 if double_buffered else 1
+        self._frames = [
+            _SpiFrame(frame_size, WS2812SpiDriver.PREAMBLE, self._max_transfer)
+            for _ in range(n_frames)
+        ]
+        self._next_frame = 0
+        
+        # A single worker keeps frames in order; os.write releases the GIL during the transfer
+        self._executor = ThreadPoolExecutor(max_workers=1) if double_buffered else None
+        self._pending: Future | None = None
 
     def write(self, buffer: np.ndarray) -> None:
         """
@@ -312,21 +554,96 @@ class WS2812SpiDriver(WS2812StripDriver):
         :param buffer: A 2D numpy array of shape (num_leds, 3) for RGB or (num_leds, 4) for RGBW
                        where the last dimension is the GRB or GRBW values
         """
-        # Use pre-allocated buffer and lookup table for maximum speed
-        offset = WS2812SpiDriver.PREAMBLE
-        flattened_colors = buffer.ravel()
+        # The encoders treat every element as one byte: other dtypes would be clipped by the lookup
+        # table but wrapped by the compiled encoders, so only uint8 is accepted
+        if buffer.dtype != np.uint8:
+            raise ValueError(f"Invalid buffer dtype: {buffer.dtype}. Expected uint8")
+        
+        # The encoders write into a fixed-size frame, a buffer of any other size must never reach them
+        if buffer.size != self._n_color_bytes:
+            raise ValueError(
+                f"Invalid buffer size: {buffer.size} color bytes. Expected {self._n_color_bytes} "
+                f"({self._led_count} LEDs x {self._bytes_per_pixel} bytes)"
+            )
         
-        # Fast lookup-based encoding (no bit manipulation in hot path)
-        for byte_val in flattened_colors:
-            encoded = WS2812SpiDriver._SPI_LOOKUP[byte_val]
-            self._spi_buffer[offset:offset+3] = encoded
-            offset += 3
+        frame = self._frames[self._next_frame]
+        neon_encode = WS2812SpiDriver._NEON_ENCODE
         
-        self._device.writebytes2(self._spi_buffer)
+        if self._full_brightness and neon_encode is not None:
+            # NEON table-lookup encoder (_encode_neon.so built and verified), needs a contiguous input
+            colors = np.ascontiguousarray(buffer)
+            neon_encode(colors.ctypes.data, frame.payload_addr, colors.size)
+        elif self._full_brightness and _encode_frame is not None:
+            # Compiled bit-shift kernel (numba installed)
+            _encode_frame(buffer.ravel(), frame.payload_3d)
+        else:
+            # Single vectorized gather from the lookup table at the current brightness.
+            # Only uint8 buffers get here, so the indices are always in range and mode="clip"
+            # (which lets NumPy write straight into out) never clips anything.
+            np.take(self._lut_spi, buffer.ravel(), axis=0, out=frame.payload_3d, mode="clip")
+        
+        if self._executor is None:
+            self._transmit(frame.transfers)
+            return
+        
+        # Wait for the previous frame, then hand this one to the writer thread and return
+        self._wait_pending()
+        self._pending = self._executor.submit(self._transmit, frame.transfers)
+        self._next_frame ^= 1
+
+    def set_brightness(self, brightness: float) -> None:
+        """
+        Fold the brightness into the SPI lookup table, so frames are encoded already scaled.
+        Each call re-encodes 256 entries, the frames in between cost nothing extra.
+        :param brightness: The brightness as a float between 0.0 and 1.0
+        """
+        bright = _quantize_brightness(brightness)
+        self._full_brightness = bright == 255
+        if self._full_brightness:
+            self._lut_spi = WS2812SpiDriver._SPI_LOOKUP
+        else:
+            # Same integer rounding as Strip.show(): k * bright / 255, rounded
+            t = np.arange(256, dtype=np.uint16) * bright + 128
+            scaled = (t + (t >> 8)) >> 8
+            self._lut_spi = WS2812SpiDriver._SPI_LOOKUP[scaled]
 
     def clear(self) -> None:
         """Reset all LEDs to off"""
-        self._device.writebytes2(self._clear_buffer)
+        self._wait_pending()
+        self._transmit(self._clear_transfers)
+
+    def close(self) -> None:
+        """
+        Wait for the last frame to be sent, stop the writer thread and close the SPI device.
+        Errors from the last frame are raised here.
+        """
+        try:
+            self._wait_pending()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            self._device.close()
+
+    def _wait_pending(self) -> None:
+        """Block until the frame handed to the writer thread has been sent (re-raises write errors)."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def _transmit(self, transfers: tuple[memoryview, ...]) -> None:
+        """
+        Send a complete SPI frame.
+        :param transfers: The encoded frame including the preamble, split at the spidev bufsiz
+        """
+        if self._fd is None:
+            for data in transfers:
+                self._device.writebytes2(data)
+            return
+        
+        fd = self._fd
+        for data in transfers:
+            os.write(fd, data)
 
     def get_led_count(self) -> int:
         return self._led_count